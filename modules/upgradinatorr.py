@@ -1,13 +1,34 @@
+import json
+import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from util.arrpy import BaseARRClient, create_arr_client
 from util.logger import Logger
 from util.notification import send_notification
 from util.utility import create_table, print_settings
 
-VALID_STATUSES = {"continuing", "airing", "ended", "canceled", "released"}
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Pretty-print obj as JSON using orjson."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        """Pretty-print obj as JSON using the stdlib encoder."""
+        return json.dumps(obj, indent=2)
+
+
+MAX_WORKERS = 8
+VALID_STATUSES = frozenset(("continuing", "airing", "ended", "canceled", "released"))
 
 
 def filter_media(
@@ -17,10 +38,13 @@ def filter_media(
     count: int,
     season_monitored_threshold: int,
     logger: Logger,
-) -> List[Dict[str, Any]]:
+    instance_name: str,
+) -> Tuple[List[Dict[str, Any]], List[int], int, int]:
     """
     Filter and return media entries that are eligible for processing.
 
+    Tagged/untagged totals are counted over the whole library in the same pass.
+
     Args:
         media_dict: List of media entries.
         checked_tag_id: Tag ID for already-processed items.
@@ -28,72 +52,84 @@ def filter_media(
         count: Max number of entries to process.
         season_monitored_threshold: Minimum monitored episode percentage.
         logger: Logger instance.
+        instance_name: Instance name used to tag log lines.
     Returns:
-        Filtered list of media entries to process.
+        Tuple of (filtered entries, their media IDs, tagged count, untagged count).
     """
+    debug_enabled: bool = logger.isEnabledFor(logging.DEBUG)
     filtered_media_dict: List[Dict[str, Any]] = []
+    media_ids: List[int] = []
     filter_count: int = 0
-    for item in media_dict:
+    tagged_count: int = 0
+    stop: int = len(media_dict)
+    for index, item in enumerate(media_dict):
         if filter_count == count:
+            stop = index
             break
+        tags = item["tags"]
+        is_tagged = checked_tag_id in tags
+        tagged_count += is_tagged
         # Filter out media that is tagged, ignored, unmonitored, or not in valid status
-        if (
-            checked_tag_id in item["tags"]
-            or ignore_tag_id in item["tags"]
-            or not item["monitored"]
-            or item["status"] not in VALID_STATUSES
-        ):
-            reasons = []
-            if checked_tag_id in item["tags"]:
-                reasons.append("tagged")
-            if ignore_tag_id in item["tags"]:
-                reasons.append("ignore")
-            if not item["monitored"]:
-                reasons.append("unmonitored")
-            if item["status"] not in VALID_STATUSES:
-                reasons.append(f"status={item['status']}")
-            logger.debug(
-                f"Skipping {item['title']} ({item['year']}), Reason: {', '.join(reasons)}"
-            )
+        is_ignored = ignore_tag_id in tags
+        monitored = item["monitored"]
+        status = item["status"]
+        valid_status = status in VALID_STATUSES
+        if is_tagged or is_ignored or not monitored or not valid_status:
+            # Most of the library lands here; only build the reason text if it is logged
+            if debug_enabled:
+                reasons = []
+                if is_tagged:
+                    reasons.append("tagged")
+                if is_ignored:
+                    reasons.append("ignore")
+                if not monitored:
+                    reasons.append("unmonitored")
+                if not valid_status:
+                    reasons.append(f"status={status}")
+                logger.debug(
+                    f"[{instance_name}] Skipping {item['title']} ({item['year']}), Reason: {', '.join(reasons)}"
+                )
             continue
         # Disable season if monitored percentage falls below threshold
-        if item["seasons"]:
+        seasons = item["seasons"]
+        if seasons:
             series_monitored = False
-            for i, season in enumerate(item["seasons"]):
-                monitored_count = 0
-                for episode in season["episode_data"]:
-                    if episode["monitored"]:
-                        monitored_count += 1
-                if len(season["episode_data"]) > 0:
-                    monitored_percentage = (
-                        monitored_count / len(season["episode_data"])
-                    ) * 100
+            for i, season in enumerate(seasons):
+                episode_data = season["episode_data"]
+                episode_count = len(episode_data)
+                if episode_count > 0:
+                    monitored_count = sum(1 for ep in episode_data if ep["monitored"])
+                    monitored_percentage = (monitored_count / episode_count) * 100
                 else:
                     logger.debug(
-                        f"Skipping {item['title']} ({item['year']}), Season {i} unmonitored. Reason: No episodes in season."
+                        f"[{instance_name}] Skipping {item['title']} ({item['year']}), Season {i} unmonitored. Reason: No episodes in season."
                     )
                     continue
                 if (
                     season_monitored_threshold is not None
                     and monitored_percentage < season_monitored_threshold
                 ):
-                    item["seasons"][i]["monitored"] = False
+                    season["monitored"] = False
                     logger.debug(
-                        f"{item['title']}, Season {i} unmonitored. Reason: monitored percentage {int(monitored_percentage)}% less than season_monitored_threshold {int(season_monitored_threshold)}%"
+                        f"[{instance_name}] {item['title']}, Season {i} unmonitored. Reason: monitored percentage {int(monitored_percentage)}% less than season_monitored_threshold {int(season_monitored_threshold)}%"
                     )
-                if item["seasons"][i]["monitored"]:
+                if season["monitored"]:
                     series_monitored = True
             if not series_monitored:
                 logger.debug(
-                    f"Skipping {item['title']} ({item['year']}), Status: {item['status']}, Monitored: {item['monitored']}, Tags: {item['tags']}"
+                    f"[{instance_name}] Skipping {item['title']} ({item['year']}), Status: {status}, Monitored: {monitored}, Tags: {tags}"
                 )
                 continue
         filtered_media_dict.append(item)
+        media_ids.append(item["media_id"])
         logger.info(
-            f"Queued for upgrade: {item['title']} ({item['year']}) [ID: {item['media_id']}]"
+            f"[{instance_name}] Queued for upgrade: {item['title']} ({item['year']}) [ID: {item['media_id']}]"
         )
         filter_count += 1
-    return filtered_media_dict
+    # Batch is full; the rest of the library only contributes to the tagged total
+    tagged_count += sum(checked_tag_id in item["tags"] for item in media_dict[stop:])
+    untagged_count = len(media_dict) - tagged_count
+    return filtered_media_dict, media_ids, tagged_count, untagged_count
 
 
 def process_search_response(
@@ -115,23 +151,25 @@ def process_search_response(
     """
     if search_response:
         logger.debug(
-            f"    [CMD] Waiting for command to complete for search response ID: {search_response['id']}"
+            f"[{app.instance_name}]     [CMD] Waiting for command to complete for search response ID: {search_response['id']}"
         )
         ready = app.wait_for_command(search_response["id"])
         if ready:
             logger.debug(
-                f"    [CMD] Command completed successfully for search response ID: {search_response['id']}"
+                f"[{app.instance_name}]     [CMD] Command completed successfully for search response ID: {search_response['id']}"
             )
         else:
             logger.debug(
-                f"    [CMD] Command did not complete successfully for search response ID: {search_response['id']}"
+                f"[{app.instance_name}]     [CMD] Command did not complete successfully for search response ID: {search_response['id']}"
             )
     else:
-        logger.warning(f"No search response for media ID: {media_id}")
+        logger.warning(
+            f"[{app.instance_name}] No search response for media ID: {media_id}"
+        )
 
 
 def process_queue(
-    queue: Dict[str, Any], instance_type: str, media_ids: List[int]
+    queue: Dict[str, Any], instance_type: str, media_ids: Iterable[int]
 ) -> List[Dict[str, Any]]:
     """
     Extract download records for matching media IDs from the queue.
@@ -139,12 +177,15 @@ def process_queue(
     Args:
         queue: Queue data from the API.
         instance_type: "radarr" or "sonarr".
-        media_ids: List of media IDs to filter.
+        media_ids: Media IDs to filter.
     Returns:
         List of dicts with download info for matching media IDs.
     """
     id_type = "movieId" if instance_type == "radarr" else "seriesId"
-    queue_dict: List[Dict[str, Any]] = []
+    if not isinstance(media_ids, (set, frozenset)):
+        media_ids = set(media_ids)
+    # Keyed by downloadId so duplicate records (e.g. one per episode) collapse
+    queue_dict: Dict[str, Dict[str, Any]] = {}
     records = queue.get("records", [])
     for item in records:
         media_id = item.get(id_type)
@@ -153,17 +194,16 @@ def process_queue(
         # Only add if 'downloadId' exists in the item
         if "downloadId" not in item:
             continue
-        queue_dict.append(
+        queue_dict.setdefault(
+            item["downloadId"],
             {
                 "download_id": item["downloadId"],
                 "media_id": media_id,
                 "download": item.get("title"),
                 "torrent_custom_format_score": item.get("customFormatScore"),
-            }
+            },
         )
-    # Remove duplicate download records
-    queue_dict = [dict(t) for t in {tuple(d.items()) for d in queue_dict}]
-    return queue_dict
+    return list(queue_dict.values())
 
 
 def process_instance(
@@ -185,9 +225,6 @@ def process_instance(
     Returns:
         Dictionary of summary and media results, or None.
     """
-    tagged_count: int = 0
-    untagged_count: int = 0
-    total_count: int = 0
     count: int = instance_settings.get("count", 2)
     checked_tag_name: str = instance_settings.get("tag_name", "checked")
     ignore_tag_name: str = instance_settings.get("ignore_tag", "ignore")
@@ -196,11 +233,11 @@ def process_instance(
         "season_monitored_threshold", 0
     )
 
-    logger.info(f"Gathering media from {app.instance_name} ({instance_type})")
+    logger.info(f"[{app.instance_name}] Gathering media ({instance_type})")
     # Set default for season_monitored_threshold to 1 if not provided
     if season_monitored_threshold is None:
         logger.warning(
-            f"No 'season_monitored_threshold' provided for {app.instance_name}. Defaulting to 1."
+            f"[{app.instance_name}] No 'season_monitored_threshold' provided. Defaulting to 1."
         )
         season_monitored_threshold = 1
     media_dict: List[Dict[str, Any]] = (
@@ -213,88 +250,92 @@ def process_instance(
     if ignore_tag_name:
         ignore_tag_id: int = app.get_tag_id_from_name(ignore_tag_name)
 
-    filtered_media_dict: List[Dict[str, Any]] = filter_media(
+    filtered_media_dict, media_ids, tagged_count, untagged_count = filter_media(
         media_dict,
         checked_tag_id,
         ignore_tag_id,
         count,
         season_monitored_threshold,
         logger,
+        app.instance_name,
     )
     if not filtered_media_dict and unattended:
         logger.info(
-            f"All media for {app.instance_name} is already tagged—removing tags for unattended operation."
+            f"[{app.instance_name}] All media is already tagged—removing tags for unattended operation."
         )
-        media_ids = [item["media_id"] for item in media_dict]
-        logger.info("All media is tagged. Removing tags...")
-        app.remove_tags(media_ids, checked_tag_id)
+        logger.info(f"[{app.instance_name}] All media is tagged. Removing tags...")
+        app.remove_tags([item["media_id"] for item in media_dict], checked_tag_id)
         media_dict = (
             app.get_parsed_media(include_episode=True)
             if app.instance_type.lower() == "sonarr"
             else app.get_parsed_media()
         )
-        filtered_media_dict = filter_media(
+        filtered_media_dict, media_ids, tagged_count, untagged_count = filter_media(
             media_dict,
             checked_tag_id,
             ignore_tag_id,
             count,
             season_monitored_threshold,
             logger,
+            app.instance_name,
         )
 
     if not filtered_media_dict and not unattended:
-        logger.info(f"No media left to process for {app.instance_name}.")
+        logger.info(f"[{app.instance_name}] No media left to process.")
         logger.warning(
-            f"No media found for {app.instance_name}. Reason: nothing left to tag."
+            f"[{app.instance_name}] No media found. Reason: nothing left to tag."
         )
         return None
 
-    logger.debug(f"Filtered media count: {len(filtered_media_dict)}")
-    if media_dict:
-        total_count = len(media_dict)
-        for item in media_dict:
-            if checked_tag_id in item["tags"]:
-                tagged_count += 1
-            else:
-                untagged_count += 1
+    logger.debug(
+        f"[{app.instance_name}] Filtered media count: {len(filtered_media_dict)}"
+    )
 
     output_dict: Dict[str, Any] = {
         "server_name": app.instance_name,
         "tagged_count": tagged_count,
         "untagged_count": untagged_count,
-        "total_count": total_count,
+        "total_count": len(media_dict),
         "data": [],
     }
+    # Nothing eligible even after an unattended reset; skip the search and queue calls
+    if not filtered_media_dict:
+        logger.info(f"[{app.instance_name}] No media left to process.")
+        return output_dict
 
     if not config.dry_run:
         search_count: int = 0
-        media_ids: List[int] = [item["media_id"] for item in filtered_media_dict]
         # Search logic: trigger searches and tag after search
         for item in filtered_media_dict:
+            if app.stop_event.is_set():
+                logger.warning(
+                    f"[{app.instance_name}] Interrupted, skipping remaining searches."
+                )
+                return None
             logger.debug("")  # Blank line before block
             logger.debug("═" * 70)
             logger.debug(
-                f"[PROCESSING] {item['title']} ({item['year']}) | ID: {item['media_id']}"
+                f"[{app.instance_name}] [PROCESSING] {item['title']} ({item['year']}) | ID: {item['media_id']}"
             )
             logger.debug("═" * 70)
 
             if item["seasons"] is None:
                 logger.debug(
-                    f"Searching media without seasons for media ID: {item['media_id']}"
+                    f"[{app.instance_name}] Searching media without seasons for media ID: {item['media_id']}"
                 )
                 search_response = app.search_media(item["media_id"])
                 process_search_response(search_response, item["media_id"], app, logger)
                 logger.debug(
-                    f"  [TAG] Adding tag {checked_tag_id} to media ID: {item['media_id']}"
+                    f"[{app.instance_name}]   [TAG] Adding tag {checked_tag_id} to media ID: {item['media_id']}"
                 )
                 app.add_tags(item["media_id"], checked_tag_id)
                 search_count += 1
                 if search_count >= count:
                     logger.debug(
-                        f"🔁 Reached search count limit after non-season search ({search_count} >= {count}), breaking."
+                        f"[{app.instance_name}] 🔁 Reached search count limit after non-season search ({search_count} >= {count}), breaking."
                     )
                     logger.debug("─" * 70)
-                    logger.debug(f"[END] Finished: {item['title']} ({item['year']}) | ID: {item['media_id']}")
+                    logger.debug(f"[{app.instance_name}] [END] Finished: {item['title']} ({item['year']}) | ID: {item['media_id']}")
                     logger.debug("─" * 70)
                     logger.debug("")
                     break
@@ -303,7 +344,7 @@ def process_instance(
                 for season in item["seasons"]:
                     if season["monitored"]:
                         logger.debug(
-                            f"  [SEASON] {season['season_number']}: Searching..."
+                            f"[{app.instance_name}]   [SEASON] {season['season_number']}: Searching..."
                         )
                         search_response = app.search_season(
                             item["media_id"], season["season_number"]
@@ -315,68 +356,102 @@ def process_instance(
 
                 if searched:
                     logger.debug(
-                        f"  [TAG] Adding tag {checked_tag_id} to media ID: {item['media_id']}"
+                        f"[{app.instance_name}]   [TAG] Adding tag {checked_tag_id} to media ID: {item['media_id']}"
                     )
                     app.add_tags(item["media_id"], checked_tag_id)
                     search_count += 1
                     if search_count >= count:
                         logger.debug(
-                            f"🔁 Reached series-based search count limit ({search_count} >= {count}), breaking."
+                            f"[{app.instance_name}] 🔁 Reached series-based search count limit ({search_count} >= {count}), breaking."
                         )
                         logger.debug("─" * 70)
-                        logger.debug(f"[END] Finished: {item['title']} ({item['year']}) | ID: {item['media_id']}")
+                        logger.debug(f"[{app.instance_name}] [END] Finished: {item['title']} ({item['year']}) | ID: {item['media_id']}")
                         logger.debug("─" * 70)
                         logger.debug("")
                         break
 
             logger.debug("─" * 70)
-            logger.debug(f"[END] Finished: {item['title']} ({item['year']}) | ID: {item['media_id']}")
+            logger.debug(f"[{app.instance_name}] [END] Finished: {item['title']} ({item['year']}) | ID: {item['media_id']}")
             logger.debug("─" * 70)
             logger.debug("")  # Blank line after block
-            logger.info(f"Finished processing: {item['title']} ({item['year']})")
+            logger.info(
+                f"[{app.instance_name}] Finished processing: {item['title']} ({item['year']})"
+            )
 
         logger.info(
-            f"Completed upgrade operations for {app.instance_name}. Now retrieving download queue..."
+            f"[{app.instance_name}] Completed upgrade operations. Now retrieving download queue..."
+        )
+        queue = app.get_queue(media_ids) or {}
+        logger.debug(
+            f"[{app.instance_name}] Queue item count: {len(queue.get('records', []))}"
         )
-        queue = app.get_queue()
-        logger.debug(f"Queue item count: {len(queue.get('records', []))}")
         queue_dict: List[Dict[str, Any]] = process_queue(
             queue, instance_type, media_ids
         )
-        logger.debug(f"Queue dict item count: {len(queue_dict)}")
+        logger.debug(f"[{app.instance_name}] Queue dict item count: {len(queue_dict)}")
 
-        queue_map: Dict[int, List[Dict[str, Any]]] = {}
+        # Index downloads by media_id once so each item is a single lookup
+        queue_by_media: Dict[int, Dict[str, Any]] = {}
         for q in queue_dict:
-            queue_map.setdefault(q["media_id"], []).append(q)
+            queue_by_media.setdefault(q["media_id"], {})[q["download"]] = q[
+                "torrent_custom_format_score"
+            ]
 
-        for item in filtered_media_dict:
-            # Downloads are processed per media_id from the queue
-            downloads = {
-                q["download"]: q["torrent_custom_format_score"]
-                for q in queue_map.get(item["media_id"], [])
+        output_dict["data"] = [
+            {
+                "media_id": item["media_id"],
+                "title": item["title"],
+                "year": item["year"],
+                "download": queue_by_media.get(item["media_id"], {}),
             }
-            output_dict["data"].append(
-                {
-                    "media_id": item["media_id"],
-                    "title": item["title"],
-                    "year": item["year"],
-                    "download": downloads,
-                }
-            )
+            for item in filtered_media_dict
+        ]
     else:
-        for item in filtered_media_dict:
-            output_dict["data"].append(
-                {
-                    "media_id": item["media_id"],
-                    "title": item["title"],
-                    "year": item["year"],
-                    "download": None,
-                    "torrent_custom_format_score": None,
-                }
-            )
+        output_dict["data"] = [
+            {
+                "media_id": item["media_id"],
+                "title": item["title"],
+                "year": item["year"],
+                "download": None,
+                "torrent_custom_format_score": None,
+            }
+            for item in filtered_media_dict
+        ]
     return output_dict
 
 
+def run_instance(
+    instance_type: str,
+    instance_entry: Dict[str, Any],
+    url: str,
+    api: str,
+    logger: Logger,
+    config: SimpleNamespace,
+    stop_event: threading.Event,
+) -> Optional[Dict[str, Any]]:
+    """
+    Connect to a single instance and process it; run from a worker thread.
+
+    Args:
+        instance_type: "radarr" or "sonarr".
+        instance_entry: Instance-specific settings from config.
+        url: Instance URL.
+        api: Instance API key.
+        logger: Logger instance.
+        config: Global config.
+        stop_event: Set by main on interrupt to stop in-flight work.
+    Returns:
+        process_instance output ({} if nothing to do), or None if unreachable.
+    """
+    if stop_event.is_set():
+        return None
+    app = create_arr_client(url, api, logger)
+    if not app or not app.connect_status:
+        return None
+    app.stop_event = stop_event
+    return process_instance(instance_type, instance_entry, app, logger, config) or {}
+
+
 def print_output(output_dict: Dict[str, Any], logger: Logger) -> None:
     """
     Print a human-readable summary of upgrade results for each instance.
@@ -397,12 +472,18 @@ def print_output(output_dict: Dict[str, Any], logger: Logger) -> None:
                     f"Upgrade summary for {run_data['server_name']}: {run_data.get('untagged_count', 0)} untagged, {run_data.get('tagged_count', 0)} tagged, {run_data.get('total_count', 0)} total."
                 )
                 for item in instance_data:
-                    logger.info(f"{item['title']} ({item['year']})")
-                    if item["download"]:
-                        for download, format_score in item["download"].items():
-                            logger.info(f"\t{download}\tScore: {format_score}")
-                    else:
-                        logger.info("\tNo upgrades found for this item.")
+                    header = f"{item['title']} ({item['year']})"
+                    body = (
+                        [
+                            f"\t{download}\tScore: {format_score}"
+                            for download, format_score in item["download"].items()
+                        ]
+                        if item["download"]
+                        else ["\tNo upgrades found for this item."]
+                    )
+                    # One record per line so every line keeps the log prefix
+                    for line in [header, *body]:
+                        logger.info(line)
                     logger.info("")
             else:
                 logger.info(f"No items found for {instance}.")
@@ -428,23 +509,66 @@ def main(config: SimpleNamespace) -> None:
             logger.error("No instances found in config file.")
             sys.exit()
         final_output_dict: Dict[str, Any] = {}
+        jobs: List[Tuple[str, str, Dict[str, Any], Dict[str, Any]]] = []
         for instance_entry in config.instances_list:
             instance_name = instance_entry.get("instance")
             if not instance_name:
                 continue
             for instance_type, instance_data in config.instances_config.items():
                 if instance_name in instance_data:
-                    url = instance_data[instance_name]["url"]
-                    api = instance_data[instance_name]["api"]
-                    app = create_arr_client(url, api, logger)
-                    if app and app.connect_status:
-                        output = process_instance(
-                            instance_type, instance_entry, app, logger, config
+                    jobs.append(
+                        (
+                            instance_name,
+                            instance_type,
+                            instance_entry,
+                            instance_data[instance_name],
                         )
-                        final_output_dict.setdefault(instance_name, {}).update(
-                            output or {}
+                    )
+        if jobs:
+            # Instances are independent and mostly wait on HTTP, so run them together
+            workers = min(MAX_WORKERS, len(jobs))
+            stop_event = threading.Event()
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = [
+                    (
+                        instance_name,
+                        executor.submit(
+                            run_instance,
+                            instance_type,
+                            instance_entry,
+                            instance_conn["url"],
+                            instance_conn["api"],
+                            logger,
+                            config,
+                            stop_event,
+                        ),
+                    )
+                    for instance_name, instance_type, instance_entry, instance_conn in jobs
+                ]
+                # Collect in config order so output and notifications stay stable
+                for instance_name, future in futures:
+                    try:
+                        output = future.result()
+                    except Exception:
+                        # Keep the other instances' results; their media is already tagged
+                        logger.error(
+                            f"[{instance_name}] An error occurred while processing this instance:",
+                            exc_info=True,
                         )
+                        continue
+                    if output is not None:
+                        final_output_dict.setdefault(instance_name, {}).update(output)
+            except KeyboardInterrupt:
+                # Don't block on workers that may be polling long-running commands
+                stop_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
         logger.debug(f"Processed instances: {list(final_output_dict.keys())}")
+        # Single dump of the collected results; skipped entirely outside debug runs
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"final_output_dict:\n{_dumps(final_output_dict)}")
         if final_output_dict:
             print_output(final_output_dict, logger)
             send_notification(
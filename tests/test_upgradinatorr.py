@@ -0,0 +1,97 @@
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from modules.upgradinatorr import filter_media, process_instance, process_queue
+
+
+class DummyLogger:
+    def __init__(self):
+        self.logs = []
+
+    def isEnabledFor(self, level): return True
+    def info(self, msg): self.logs.append(f"INFO: {msg}")
+    def debug(self, msg): self.logs.append(f"DEBUG: {msg}")
+    def warning(self, msg): self.logs.append(f"WARNING: {msg}")
+    def error(self, msg, **kwargs): self.logs.append(f"ERROR: {msg}")
+
+
+CHECKED_TAG = 1
+
+
+def make_media(media_id, tags):
+    return {
+        "media_id": media_id,
+        "title": f"Movie {media_id}",
+        "year": 2000 + media_id,
+        "tags": tags,
+        "monitored": True,
+        "status": "released",
+        "seasons": None,
+    }
+
+
+class StubClient:
+    """Radarr-like client whose library is fully tagged until remove_tags runs."""
+
+    def __init__(self, media_ids):
+        self.instance_name = "radarr_1"
+        self.instance_type = "Radarr"
+        self.stop_event = threading.Event()
+        self.media_ids = media_ids
+        self.tagged = True
+        self.removed = None
+
+    def get_parsed_media(self, include_episode=False):
+        tags = [CHECKED_TAG] if self.tagged else []
+        return [make_media(media_id, list(tags)) for media_id in self.media_ids]
+
+    def get_tag_id_from_name(self, tag_name):
+        return CHECKED_TAG if tag_name == "checked" else 2
+
+    def remove_tags(self, media_ids, tag_id):
+        self.removed = (media_ids, tag_id)
+        self.tagged = False
+
+
+def test_filter_media_counts_whole_library():
+    media = [make_media(i, [CHECKED_TAG] if i % 3 == 0 else []) for i in range(10)]
+    filtered, media_ids, tagged, untagged = filter_media(
+        media, CHECKED_TAG, 2, 3, 0, DummyLogger(), "radarr_1"
+    )
+    assert media_ids == [1, 2, 4]
+    assert [item["media_id"] for item in filtered] == media_ids
+    assert (tagged, untagged) == (4, 6)
+
+
+def test_process_queue_dedupes_and_filters():
+    queue = {
+        "records": [
+            {"movieId": 1, "downloadId": "a", "title": "A", "customFormatScore": 5},
+            {"movieId": 1, "downloadId": "a", "title": "A", "customFormatScore": 5},
+            {"movieId": 2, "downloadId": "b", "title": "B"},
+            {"movieId": 3, "downloadId": "c", "title": "C"},
+            {"movieId": 1, "title": "no download id"},
+        ]
+    }
+    result = process_queue(queue, "radarr", [1, 2])
+    assert [q["download_id"] for q in result] == ["a", "b"]
+    assert result[0]["torrent_custom_format_score"] == 5
+
+
+def test_process_instance_unattended_reset():
+    app = StubClient([1, 2, 3])
+    logger = DummyLogger()
+    settings = {"count": 2, "unattended": True, "season_monitored_threshold": 0}
+    config = SimpleNamespace(dry_run=True)
+
+    output = process_instance("radarr", settings, app, logger, config)
+
+    assert app.removed == ([1, 2, 3], CHECKED_TAG)
+    assert output["server_name"] == "radarr_1"
+    assert (output["tagged_count"], output["untagged_count"]) == (0, 3)
+    assert output["total_count"] == 3
+    assert [item["media_id"] for item in output["data"]] == [1, 2]
+    assert any("[radarr_1] Queued for upgrade" in log for log in logger.logs)
@@ -1,10 +1,12 @@
 import html
 import logging
 import os
+import threading
 import time
 from typing import Any, Dict, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from unidecode import unidecode
 
 from util.constants import windows_path_regex, year_regex
@@ -13,11 +15,19 @@ from util.normalization import normalize_titles
 
 logging.getLogger("requests").setLevel(logging.WARNING)
 
+POOL_SIZE = 10
+
 
 class BaseARRClient:
     """Base class for interacting with ARR (Radarr/Sonarr) instances."""
 
-    def __init__(self, url: str, api: str, logger: Any) -> None:
+    def __init__(
+        self,
+        url: str,
+        api: str,
+        logger: Any,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         """
         Initialize the base ARR client.
 
@@ -25,6 +35,7 @@ class BaseARRClient:
             url (str): API URL.
             api (str): API key.
             logger (Any): Logger instance.
+            session (Optional[requests.Session]): Existing session to reuse.
         """
         self.logger = logger
         self.max_retries = 5
@@ -36,13 +47,16 @@ class BaseARRClient:
             "Content-Type": "application/json",
             "X-Api-Key": api,
         }
-        self.session = requests.Session()
+        self.session = session or self._create_session()
         self.session.headers.update({"X-Api-Key": self.api})
         self.connect_status = False
         self.instance_type = None
         self.instance_name = None
         self.app_name = None
         self.app_version = None
+        self._tag_ids: Optional[Dict[str, int]] = None
+        # Set by callers running clients in worker threads to abort command polling
+        self.stop_event = threading.Event()
         status = self.get_system_status()
         if not status:
             return
@@ -54,6 +68,22 @@ class BaseARRClient:
             f"Connected to {self.app_name} v{self.app_version} at {self.url}"
         )
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create a session with a keep-alive connection pool.
+
+        Retries stay in _request_with_retries, so the adapter does not retry.
+
+        Returns:
+            requests.Session: Configured session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def get_health(self) -> Optional[Dict[str, Any]]:
         """
         Get the health status of the ARR instance.
@@ -64,33 +94,49 @@ class BaseARRClient:
         endpoint = f"{self.url}/api/v3/health"
         return self.make_get_request(endpoint, headers=self.headers)
 
-    def wait_for_command(self, command_id: int) -> bool:
+    def wait_for_command(self, command_id: int, timeout: int = 600) -> bool:
         """
         Poll the given command ID until it completes, fails, or times out.
 
+        Polling starts at 0.5s and backs off to 5s, so short commands return
+        quickly without hammering the API on long ones. Setting stop_event
+        aborts the wait.
+
         Args:
             command_id (int): Command ID to wait for.
+            timeout (int): Seconds to wait before giving up.
         Returns:
             bool: True if successful, False otherwise.
         """
-        self.logger.debug("Waiting for command to complete...")
+        self.logger.debug(
+            f"[{self.instance_name}] Waiting for command {command_id} to complete..."
+        )
+        endpoint = f"{self.url}/api/v3/command/{command_id}"
+        deadline = time.monotonic() + timeout
+        delay = 0.5
         cycle = 0
         while True:
-            endpoint = f"{self.url}/api/v3/command/{command_id}"
             response = self.make_get_request(endpoint)
             if response and response.get("status") == "completed":
                 return True
             if response and response.get("status") == "failed":
                 return False
-            time.sleep(5)
+            if time.monotonic() >= deadline:
+                self.logger.error(
+                    f"[{self.instance_name}] Command {command_id} timed out after {timeout} seconds."
+                )
+                return False
+            if self.stop_event.wait(delay):
+                self.logger.warning(
+                    f"[{self.instance_name}] Stopped waiting for command {command_id}."
+                )
+                return False
+            delay = min(delay * 2, 5)
             cycle += 1
             if cycle % 5 == 0:
                 self.logger.debug(
-                    f"Still waiting for command {command_id}... (cycle {cycle})"
+                    f"[{self.instance_name}] Still waiting for command {command_id}... (cycle {cycle})"
                 )
-            if cycle > 120:
-                self.logger.error(f"Command {command_id} timed out after 10 minutes.")
-                return False
 
     def create_tag(self, tag: str) -> int:
         """
@@ -109,11 +155,13 @@ class BaseARRClient:
 
     def get_instance_name(self) -> Optional[str]:
         """
-        Get instance name.
+        Get instance name, reusing the one read when the client connected.
 
         Returns:
             Optional[str]: Instance name.
         """
+        if self.instance_name:
+            return self.instance_name
         status = self.get_system_status()
         return status.get("instanceName") if status else None
 
@@ -286,18 +334,27 @@ class BaseARRClient:
         """
         Retrieve a tag ID by its name, create if not exists.
 
+        Tags are fetched once per client and cached for later lookups.
+
         Args:
             tag_name (str): Tag name.
         Returns:
             int: Tag ID.
         """
-        all_tags = self.get_all_tags() or []
+        if self._tag_ids is None:
+            all_tags = self.get_all_tags()
+            # Don't cache a failed fetch, retry on the next lookup instead
+            if all_tags is None:
+                tag_ids = {}
+            else:
+                tag_ids = self._tag_ids = {tag["label"]: tag["id"] for tag in all_tags}
+        else:
+            tag_ids = self._tag_ids
         tag_name = tag_name.lower()
-        for tag in all_tags:
-            if tag["label"] == tag_name:
-                tag_id = tag["id"]
-                return tag_id
-        tag_id = self.create_tag(tag_name)
+        tag_id = tag_ids.get(tag_name)
+        if tag_id is None:
+            tag_id = self.create_tag(tag_name)
+            tag_ids[tag_name] = tag_id
         return tag_id
 
     def get_all_tags(self) -> Optional[List[Dict[str, Any]]]:
@@ -329,7 +386,13 @@ class BaseARRClient:
 class RadarrClient(BaseARRClient):
     """Client for interacting with Radarr API."""
 
-    def __init__(self, url: str, api: str, logger: Any) -> None:
+    def __init__(
+        self,
+        url: str,
+        api: str,
+        logger: Any,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         """
         Initialize the Radarr client.
 
@@ -337,8 +400,9 @@ class RadarrClient(BaseARRClient):
             url (str): API URL.
             api (str): API key.
             logger (Any): Logger instance.
+            session (Optional[requests.Session]): Existing session to reuse.
         """
-        super().__init__(url, api, logger)
+        super().__init__(url, api, logger, session)
         self.instance_type = "Radarr"
 
     def get_media(self) -> Optional[List[Dict[str, Any]]]:
@@ -515,13 +579,18 @@ class RadarrClient(BaseARRClient):
         endpoint = f"{self.url}/api/v3/history/{url_addon}"
         return self.make_get_request(endpoint, headers=self.headers)
 
-    def get_queue(self) -> Any:
+    def get_queue(self, media_ids: Optional[List[int]] = None) -> Any:
         """
         Get the current queue from Radarr.
+
+        Args:
+            media_ids (Optional[List[int]]): Only return queue records for these IDs.
         Returns:
             Any: API response.
         """
         url_addon = "page=1&pageSize=200&includeMovie=true"
+        if media_ids:
+            url_addon += "".join(f"&movieIds={media_id}" for media_id in media_ids)
         endpoint = f"{self.url}/api/v3/queue?{url_addon}"
         return self.make_get_request(endpoint, headers=self.headers)
 
@@ -609,7 +678,13 @@ class RadarrClient(BaseARRClient):
 class SonarrClient(BaseARRClient):
     """Client for interacting with Sonarr API."""
 
-    def __init__(self, url: str, api: str, logger: Any) -> None:
+    def __init__(
+        self,
+        url: str,
+        api: str,
+        logger: Any,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         """
         Initialize the Sonarr client.
 
@@ -617,8 +692,9 @@ class SonarrClient(BaseARRClient):
             url (str): API URL.
             api (str): API key.
             logger (Any): Logger instance.
+            session (Optional[requests.Session]): Existing session to reuse.
         """
-        super().__init__(url, api, logger)
+        super().__init__(url, api, logger, session)
         self.instance_type = "Sonarr"
 
     def get_media(self) -> Optional[List[Dict[str, Any]]]:
@@ -901,13 +977,18 @@ class SonarrClient(BaseARRClient):
         endpoint = f"{self.url}/api/v3/history/{url_addon}"
         return self.make_get_request(endpoint, headers=self.headers)
 
-    def get_queue(self) -> Any:
+    def get_queue(self, media_ids: Optional[List[int]] = None) -> Any:
         """
         Get the current queue from Sonarr.
+
+        Args:
+            media_ids (Optional[List[int]]): Only return queue records for these IDs.
         Returns:
             Any: API response.
         """
         url_addon = "page=1&pageSize=200&includeSeries=true"
+        if media_ids:
+            url_addon += "".join(f"&seriesIds={media_id}" for media_id in media_ids)
         endpoint = f"{self.url}/api/v3/queue?{url_addon}"
         return self.make_get_request(endpoint, headers=self.headers)
 
@@ -1074,9 +1155,10 @@ def create_arr_client(
     temp = BaseARRClient(url, api, SilentLogger())
     if not temp.connect_status:
         return None
+    # Reuse the probe's session so its pooled connection carries over
     if temp.app_name == "Radarr":
-        return RadarrClient(url, api, logger)
+        return RadarrClient(url, api, logger, temp.session)
     if temp.app_name == "Sonarr":
-        return SonarrClient(url, api, logger)
+        return SonarrClient(url, api, logger, temp.session)
     logger.error("Unknown ARR type")
     return None
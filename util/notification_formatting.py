@@ -344,9 +344,9 @@ def format_for_discord(
                     title = item.get("title", "Unknown")
                     year = f" ({item.get('year')})" if item.get("year") else ""
                     lines.append(f"{title}{year}")
-                    for t, score in dl.items():
-                        lines.append(f"\t{t}")
-                        lines.append(f"\tCF Score: {score}")
+                    lines.extend(
+                        f"\t{t}\n\tCF Score: {score}" for t, score in dl.items()
+                    )
                     lines.append("")
             if lines:
                 fields.extend(chunk_code_fields(srv, "\n".join(lines).strip()))